@@ -68,4 +68,4 @@ doc.add(
 )
 
 with open("my-document.typ", mode="wt") as f:
-    f.write(doc.render())
+    doc.render_to(f)
@@ -2,6 +2,9 @@ from typing import Optional, Any
 
 from pypst.utils import render_mapping, render_sequence
 
+# shared rendering of the common plain empty cell
+_EMPTY_CELL = "[]"
+
 
 class Cell:
     """
@@ -32,6 +35,31 @@ class Cell:
         [#table.cell(rowspan: 2, colspan: 3, fill: red, align: center, stroke: black)[Value]]
     """
 
+    __slots__ = (
+        "value",
+        "rowspan",
+        "colspan",
+        "fill",
+        "align",
+        "_stroke",
+        "_stroke_rendered",
+        "_body",
+        "_rendered",
+        "_key",
+    )
+
+    value: Optional[Any]
+    rowspan: int
+    colspan: int
+    fill: Optional[str]
+    align: Optional[str]
+    _stroke: Optional[str | list | dict]
+    # either the rendered list/dict stroke or the string passed through
+    _stroke_rendered: Optional[str]
+    _body: str
+    _rendered: Optional[str]
+    _key: Optional[tuple]
+
     def __init__(
         self,
         value: Optional[Any] = None,
@@ -41,12 +69,48 @@ class Cell:
         align: Optional[str] = None,
         stroke: Optional[str | list | dict] = None,
     ) -> None:
-        self.value = value
-        self.rowspan = rowspan
-        self.colspan = colspan
-        self.fill = fill
-        self.align = align
+        # bypass the invalidation hook during bulk construction
+        set_slot = object.__setattr__
+        set_slot(self, "value", value)
+        set_slot(self, "_body", _EMPTY_CELL if value is None else f"[{value}]")
+        set_slot(self, "rowspan", rowspan)
+        set_slot(self, "colspan", colspan)
+        set_slot(self, "fill", fill)
+        set_slot(self, "align", align)
         self.stroke = stroke
+        set_slot(self, "_rendered", None)
+        set_slot(self, "_key", None)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        # styling works by mutating attributes after construction,
+        # so any write drops the cached render and state key
+        object.__setattr__(self, name, value)
+        if name == "value":
+            # the content block only depends on the value, so it is
+            # formatted once here instead of on every render
+            object.__setattr__(
+                self, "_body", _EMPTY_CELL if value is None else f"[{value}]"
+            )
+        elif name == "_rendered" or name == "_key" or name == "_body":
+            return
+        object.__setattr__(self, "_rendered", None)
+        object.__setattr__(self, "_key", None)
+
+    @property
+    def stroke(self) -> Optional[str | list | dict]:
+        return self._stroke
+
+    @stroke.setter
+    def stroke(self, value: Optional[str | list | dict]) -> None:
+        # render the stroke once on assignment instead of
+        # re-dispatching on its type for every render call
+        self._stroke = value
+        if isinstance(value, dict):
+            self._stroke_rendered = render_mapping(value)
+        elif isinstance(value, list):
+            self._stroke_rendered = render_sequence(value)
+        else:
+            self._stroke_rendered = value
 
     def __str__(self) -> str:
         return self.render()
@@ -57,18 +121,25 @@ class Cell:
             f"fill={self.fill}, align={self.align}, stroke={self.stroke})"
         )
 
+    def _state_key(self) -> tuple:
+        key = self._key
+        if key is None:
+            key = (
+                self.value,
+                self.rowspan,
+                self.colspan,
+                self.fill,
+                self.align,
+                self._stroke,
+            )
+            self._key = key
+        return key
+
     def __eq__(self, other: Any) -> bool:
         if not isinstance(other, Cell):
             return False
 
-        return (
-            self.value == other.value
-            and self.rowspan == other.rowspan
-            and self.colspan == other.colspan
-            and self.fill == other.fill
-            and self.align == other.align
-            and self.stroke == other.stroke
-        )
+        return self._state_key() == other._state_key()
 
     def render(self) -> str:
         """
@@ -79,25 +150,41 @@ class Cell:
         Returns:
             The rendered cell.
         """
+        if self._rendered is not None:
+            return self._rendered
+
+        # fast path for unstyled cells, which are the vast majority
+        # of cells created from a data frame
+        if (
+            self.rowspan == 1
+            and self.colspan == 1
+            and self.fill is None
+            and self.align is None
+            and self._stroke is None
+        ):
+            if self.value is None:
+                return _EMPTY_CELL
+            cell = self._body
+            self._rendered = cell
+            return cell
+
+        # concatenating onto the constant labels is cheaper than
+        # re-formatting an f-string for every styled cell
         args = []
         if self.rowspan > 1:
-            args.append(f"rowspan: {self.rowspan}")
+            args.append("rowspan: " + str(self.rowspan))
         if self.colspan > 1:
-            args.append(f"colspan: {self.colspan}")
+            args.append("colspan: " + str(self.colspan))
         if self.fill is not None:
-            args.append(f"fill: {self.fill}")
+            args.append("fill: " + self.fill)
         if self.align is not None:
-            args.append(f"align: {self.align}")
-        if self.stroke is not None:
-            stroke = self.stroke
-            if isinstance(self.stroke, dict):
-                stroke = render_mapping(self.stroke)
-            elif isinstance(self.stroke, list):
-                stroke = render_sequence(self.stroke)
-            args.append(f"stroke: {stroke}")
-
-        cell = "[]" if self.value is None else f"[{self.value}]"
+            args.append("align: " + self.align)
+        if self._stroke_rendered is not None:
+            args.append("stroke: " + self._stroke_rendered)
+
+        cell = self._body
         if args:
             cell = f"[#table.cell({', '.join(args)}){cell}]"
+        self._rendered = cell
 
         return cell
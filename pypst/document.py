@@ -1,5 +1,5 @@
-from dataclasses import dataclass, field
-from typing import Optional
+import io
+from typing import Optional, TextIO
 
 from pypst import utils
 from pypst.renderable import Renderable
@@ -83,14 +83,24 @@ class Document:
         Args:
             element: The new body element.
         """
-        if not isinstance(element, (Renderable, str)):
-            raise ValueError(f"Invalid body type: {type(element)}")
-        elif isinstance(element, Document):
-            raise ValueError("Document cannot be set as value of another document")
-        elif isinstance(element, Import):
+        # fast path for the exact types produced in tight generation loops
+        if type(element) is str:
+            self._body.append(element)
+        elif type(element) is Import:
             self.imports.append(element)
         else:
-            self._body.append(element)
+            # validation is stripped when running with -O
+            if __debug__:
+                if isinstance(element, Document):
+                    raise ValueError(
+                        "Document cannot be set as value of another document"
+                    )
+                if not isinstance(element, (Renderable, str)):
+                    raise ValueError(f"Invalid body type: {type(element)}")
+            if isinstance(element, Import):
+                self.imports.append(element)
+            else:
+                self._body.append(element)
 
     def add_import(self, module: str, members: Optional[list[str]] = None) -> None:
         """
@@ -119,31 +129,75 @@ class Document:
         Returns:
             The rendered document string.
         """
-        imports = "\n".join([i.render() for i in self.imports])
-        body = "\n\n".join(utils.render(b) for b in self.body)
+        # fast path for the common single-element document
+        if not self.imports and len(self._body) == 1:
+            return utils.render(self._body[0])
 
-        if imports:
-            return f"{imports}\n\n{body}"
-        else:
-            return body
+        buffer = io.StringIO()
+        self.render_to(buffer)
+
+        return buffer.getvalue()
+
+    def render_to(self, fp: TextIO) -> None:
+        """
+        Render the document into a text file object.
+
+        This writes the same output as `render` piece by piece,
+        so the full document string is never held in memory.
+
+        Args:
+            fp: The text file object to write to.
+
+        Examples:
+            >>> doc = Document("Hello, world!")
+            >>> doc.add_import("module")
+            >>> import io
+            >>> buffer = io.StringIO()
+            >>> doc.render_to(buffer)
+            >>> print(buffer.getvalue())
+            #import "module"
+            <BLANKLINE>
+            Hello, world!
+        """
+        for i, imp in enumerate(self.imports):
+            if i > 0:
+                fp.write("\n")
+            fp.write(imp.render())
+        if self.imports:
+            fp.write("\n\n")
+        # hoist the attribute lookups out of the body loop
+        write = fp.write
+        render_into = utils.render_into
+        for i, b in enumerate(self._body):
+            if i > 0:
+                write("\n\n")
+            render_into(b, fp)
 
 
-@dataclass
 class Import:
-    module: str
-    members: list[str] = field(default_factory=list)
+    __slots__ = ("module", "members")
+
+    def __init__(self, module: str, members: Optional[list[str]] = None) -> None:
+        self.module = module
+        self.members = members if members is not None else []
+
+    def __repr__(self) -> str:
+        return f"Import(module={self.module!r}, members={self.members!r})"
 
     def render(self) -> str:
-        module = self.module.strip('"')
-        module = f'"{module}"'
-        rendered_import = f"#import {module}"
+        # not cached: module and members stay freely mutable and imports
+        # are rendered once per document anyway
+        module = (
+            self.module if self.module.startswith('"') else f'"{self.module}"'
+        )
         if self.members:
             if "*" in self.members and len(self.members) > 1:
                 raise ValueError(
                     f"Error while rendering import for '{self.module}'. "
                     "Cannot import all and specific members at the same time"
                 )
-            members = ", ".join(self.members)
-            rendered_import += f": {members}"
+            rendered_import = f"#import {module}: {', '.join(self.members)}"
+        else:
+            rendered_import = f"#import {module}"
 
         return rendered_import
@@ -51,6 +51,8 @@ class Figure:
     outlined: Optional[bool] = None
 
     def __post_init__(self) -> None:
+        if not __debug__:  # validation is stripped when running with -O
+            return
         if not isinstance(self.body, (Renderable, str)):
             raise ValueError(f"Invalid body type: {type(self.body)}")
         elif isinstance(self.body, Document):
@@ -68,7 +70,7 @@ class Figure:
             The rendered figure.
         """
         # remove the leading '#' because we're in code mode
-        args = [utils.render(self.body).lstrip("#")]
+        args = [utils.render(self.body).removeprefix("#")]
         if self.placement is not None:
             args.append(f"placement: {self.placement}")
         if self.caption is not None:
@@ -85,6 +87,6 @@ class Figure:
             args.append(f"outlined: {'true' if self.outlined else 'false'}")
 
         # indent body and args by 2 spaces
-        inner = ",\n".join(args).replace("\n", "\n  ")
+        inner = ",\n  ".join(arg.replace("\n", "\n  ") for arg in args)
 
         return "#figure(\n  {0}\n)".format(inner)
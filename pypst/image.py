@@ -1,5 +1,5 @@
-from dataclasses import dataclass
-from typing import Optional, Literal
+from dataclasses import dataclass, field
+from typing import Any, Optional, Literal
 
 
 @dataclass
@@ -30,6 +30,21 @@ class Image:
     height: Optional[str] = None
     alt: Optional[str] = None
     fit: Optional[Literal["cover", "contain", "stretch"]] = None
+    # maintained by __setattr__, not part of the dataclass interface
+    _quoted_path: str = field(init=False, repr=False, compare=False)
+    _rendered: Optional[str] = field(
+        init=False, default=None, repr=False, compare=False
+    )
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        # all fields are plain strings, so the cached render
+        # only needs to be dropped on direct attribute writes
+        object.__setattr__(self, name, value)
+        if name == "path":
+            quoted = value if value.startswith('"') else f'"{value}"'
+            object.__setattr__(self, "_quoted_path", quoted)
+        if name not in ("_rendered", "_quoted_path"):
+            object.__setattr__(self, "_rendered", None)
 
     def render(self) -> str:
         """
@@ -38,18 +53,17 @@ class Image:
         Returns:
             The rendered image element.
         """
-        path = self.path if self.path.startswith('"') else f'"{self.path}"'
-        args = [path]
-        if self.format is not None:
-            args.append(f'format: "{self.format}"')
-        if self.width is not None:
-            args.append(f"width: {self.width}")
-        if self.height is not None:
-            args.append(f"height: {self.height}")
-        if self.alt is not None:
-            args.append(f"alt: {self.alt}")
-        if self.fit is not None:
-            args.append(f'fit: "{self.fit}"')
-        rendered = f"#image({', '.join(args)})"
+        if self._rendered is not None:
+            return self._rendered
+        args = (
+            self._quoted_path,
+            f'format: "{self.format}"' if self.format is not None else None,
+            f"width: {self.width}" if self.width is not None else None,
+            f"height: {self.height}" if self.height is not None else None,
+            f"alt: {self.alt}" if self.alt is not None else None,
+            f'fit: "{self.fit}"' if self.fit is not None else None,
+        )
+        rendered = f"#image({', '.join(a for a in args if a is not None)})"
+        self._rendered = rendered
 
         return rendered
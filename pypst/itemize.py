@@ -1,4 +1,3 @@
-import itertools
 from dataclasses import dataclass
 from typing import Optional
 
@@ -67,6 +66,8 @@ class Itemize:
     body_indent: Optional[str] = None
     spacing: Optional[str] = None
 
+    _markdown_prefix = "-"
+
     def __post_init__(self) -> None:
         _check_elements(self.elements)
 
@@ -77,7 +78,12 @@ class Itemize:
         Args:
             element: The new element.
         """
-        _check_element(element)
+        # validation inlined to avoid a function frame per added element
+        if __debug__:
+            if not isinstance(element, (Renderable, str)):
+                raise ValueError(f"Invalid element type: {type(element)}")
+            if isinstance(element, Document):
+                raise ValueError("Document cannot be added as it needs to be top-level")
         self.elements.append(element)
 
     def render(self) -> str:
@@ -90,6 +96,15 @@ class Itemize:
         Returns:
             The rendered list.
         """
+        args = self._render_args()
+        if args:
+            rendered = _render_functional(args, self.elements, "list")
+        else:
+            rendered = _render_markdown(self.elements, self._markdown_prefix)
+
+        return rendered
+
+    def _render_args(self) -> list[str]:
         args = []
         if self.tight:
             args.append(f"tight: {utils.render(self.tight)}")
@@ -102,12 +117,7 @@ class Itemize:
         if self.spacing:
             args.append(f"spacing: {self.spacing}")
 
-        if args:
-            rendered = _render_functional(args, self.elements, "list")
-        else:
-            rendered = _render_markdown(self.elements, "-")
-
-        return rendered
+        return args
 
 
 @dataclass
@@ -168,6 +178,8 @@ class Enumerate:
     spacing: Optional[str] = None
     number_align: Optional[str] = None
 
+    _markdown_prefix = "+"
+
     def __post_init__(self) -> None:
         _check_elements(self.elements)
 
@@ -178,7 +190,12 @@ class Enumerate:
         Args:
             element: The new element.
         """
-        _check_element(element)
+        # validation inlined to avoid a function frame per added element
+        if __debug__:
+            if not isinstance(element, (Renderable, str)):
+                raise ValueError(f"Invalid element type: {type(element)}")
+            if isinstance(element, Document):
+                raise ValueError("Document cannot be added as it needs to be top-level")
         self.elements.append(element)
 
     def render(self) -> str:
@@ -191,6 +208,15 @@ class Enumerate:
         Returns:
             The rendered numbered list.
         """
+        args = self._render_args()
+        if args:
+            rendered = _render_functional(args, self.elements, "enum")
+        else:
+            rendered = _render_markdown(self.elements, self._markdown_prefix)
+
+        return rendered
+
+    def _render_args(self) -> list[str]:
         args = []
         if self.tight:
             args.append(f"tight: {utils.render(self.tight)}")
@@ -209,56 +235,87 @@ class Enumerate:
         if self.number_align:
             args.append(f"number-align: {self.number_align}")
 
-        if args:
-            rendered = _render_functional(args, self.elements, "enum")
-        else:
-            rendered = _render_markdown(self.elements, "+")
+        return args
 
-        return rendered
+
+# set lookup on the exact type is cheaper than an isinstance call
+# in the per-element render loops; isinstance stays as a fallback
+# so subclasses keep working
+_LIST_TYPES = {Itemize, Enumerate}
+
+# shared indent strings for the nesting depths that occur in practice
+_INDENTS = tuple("  " * d for d in range(32))
+
+
+def _indent_for(depth: int) -> str:
+    return _INDENTS[depth] if depth < len(_INDENTS) else "  " * depth
+
+
+def _unquote(s: str) -> str:
+    # cheaper than strip('"'), which scans and copies even when
+    # there are no quotes to remove
+    return s[1:-1] if len(s) >= 2 and s[0] == '"' == s[-1] else s
 
 
 def _check_elements(elements: list[Renderable | str]) -> None:
+    if not __debug__:  # validation is stripped when running with -O
+        return
     if isinstance(elements, list):
-        if any(not isinstance(e, (Renderable, str)) for e in elements):
-            raise ValueError("Encountered invalid element type in elements list")
-        if any(isinstance(e, Document) for e in elements):
-            raise ValueError("Document cannot be added as it needs to be top-level")
+        # one pass over the elements instead of two any() scans
+        for e in elements:
+            if not isinstance(e, (Renderable, str)):
+                raise ValueError("Encountered invalid element type in elements list")
+            if isinstance(e, Document):
+                raise ValueError(
+                    "Document cannot be added as it needs to be top-level"
+                )
     else:
         raise ValueError(f"Invalid elements type {type(elements)}")
 
 
-def _check_element(element: Renderable | str) -> None:
-    if not isinstance(element, (Renderable, str)):
-        raise ValueError(f"Invalid element type: {type(element)}")
-    if isinstance(element, Document):
-        raise ValueError("Document cannot be added as it needs to be top-level")
-
-
 def _render_functional(
     args: list[str], elements: list[Renderable | str], function_name: str
 ) -> str:
-    body = []
-    for e in elements:
+    # the element count is known, so preallocate instead of growing
+    body: list[str] = [""] * len(elements)
+    for i, e in enumerate(elements):
         b = utils.render(e)
-        b = f"\n{b}\n" if isinstance(e, (Itemize, Enumerate)) else b.strip('"')
-        body.append(f"[{b}]")
-    rendered = ",\n".join(itertools.chain(args, body)).replace("\n", "\n  ")
+        is_list = type(e) in _LIST_TYPES or isinstance(e, (Itemize, Enumerate))
+        b = f"\n{b}\n" if is_list else _unquote(b)
+        body[i] = f"[{b}]"
+    rendered = ",\n".join(args + body).replace("\n", "\n  ")
     rendered = f"#{function_name}(\n  {rendered}\n)"
 
     return rendered
 
 
 def _render_markdown(elements: list[Renderable | str], prefix: str) -> str:
-    body = []
+    lines: list[str] = []
+    _collect_markdown_lines(elements, prefix, 0, lines)
+
+    return "\n".join(lines)
+
+
+def _collect_markdown_lines(
+    elements: list[Renderable | str], prefix: str, depth: int, lines: list[str]
+) -> None:
+    # nested lists are descended into directly so every line is indented
+    # exactly once instead of being re-scanned on each nesting level
+    indent = _indent_for(depth)
     for e in elements:
-        b = utils.render(e)
+        # a plain isinstance check so mypy narrows e for the list branch
         if isinstance(e, (Itemize, Enumerate)):
-            b = b.replace("\n", "\n  ")
-            b = "  " + b
+            if e._render_args():
+                sub_indent = _indent_for(depth + 1)
+                for line in e.render().split("\n"):
+                    lines.append(sub_indent + line)
+            else:
+                _collect_markdown_lines(
+                    e.elements, e._markdown_prefix, depth + 1, lines
+                )
         else:
-            b = b.strip('"')
-            b = f"{prefix} {b}"
-        body.append(b)
-    rendered = "\n".join(body)
-
-    return rendered
+            b = _unquote(utils.render(e))
+            b = f"{indent}{prefix} {b}"
+            if "\n" in b:
+                b = b.replace("\n", "\n" + indent)
+            lines.append(b)
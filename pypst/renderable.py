@@ -1,5 +1,11 @@
+import functools
 from abc import ABC, abstractmethod
-from typing import Any
+from typing import Any, TextIO
+
+
+@functools.lru_cache(maxsize=None)
+def _has_render_method(subclass: type) -> bool:
+    return any("render" in B.__dict__ for B in subclass.__mro__)
 
 
 class Renderable(ABC):
@@ -7,10 +13,22 @@ class Renderable(ABC):
     def render(self) -> str:
         pass
 
+    def render_into(self, buf: TextIO) -> None:
+        """
+        Write the rendered element directly into a text buffer.
+
+        Subclasses can override this to stream their output piece by piece
+        instead of building an intermediate string.
+
+        Args:
+            buf: The text buffer to write to.
+        """
+        buf.write(self.render())
+
     @classmethod
     def __subclasshook__(cls, subclass: Any) -> bool:
         if cls is Renderable:
-            if any("render" in B.__dict__ for B in subclass.__mro__):
+            if _has_render_method(subclass):
                 return True
 
         return NotImplemented
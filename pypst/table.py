@@ -1,7 +1,7 @@
-import itertools
-from dataclasses import dataclass
-from typing import Optional, Union, Literal
+from dataclasses import dataclass, field
+from typing import Iterator, Optional, TextIO, Union, Literal
 
+import numpy as np
 import pandas as pd
 from frozendict import frozendict
 
@@ -11,7 +11,7 @@ from pypst.cell import Cell
 from pypst.utils import render_type, render_mapping
 
 
-@dataclass
+@dataclass(slots=True)
 class Table:
     """
     A table element.
@@ -32,9 +32,15 @@ class Table:
         but the elements can be accessed to apply styling to individual cells.
     """
 
-    header_data: FrozenList[FrozenList["Cell"]] = FrozenList(FrozenList([]))
-    index_data: FrozenList[FrozenList["Cell"]] = FrozenList(FrozenList([]))
-    row_data: FrozenList[FrozenList["Cell"]] = FrozenList(FrozenList([]))
+    header_data: FrozenList[FrozenList["Cell"]] = field(
+        default_factory=lambda: FrozenList([])
+    )
+    index_data: FrozenList[FrozenList["Cell"]] = field(
+        default_factory=lambda: FrozenList([])
+    )
+    row_data: FrozenList[FrozenList["Cell"]] = field(
+        default_factory=lambda: FrozenList([])
+    )
     _columns: Optional[int | str | FrozenList[str]] = None
     _rows: Optional[int | str | FrozenList[str]] = None
     _stroke: Optional[str | FrozenList[str] | frozendict[str, str]] = None
@@ -44,6 +50,18 @@ class Table:
     _column_gutter: Optional[int | str | FrozenList[str]] = None
     _row_gutter: Optional[int | str | FrozenList[str]] = None
     _lines: Optional[list["TableLine"]] = None
+    # rendered forms of the styling values, filled in by the setters so
+    # _render_args only concatenates instead of re-dispatching on type
+    _columns_rendered: Optional[str] = field(default=None, repr=False, compare=False)
+    _rows_rendered: Optional[str] = field(default=None, repr=False, compare=False)
+    _stroke_rendered: Optional[str] = field(default=None, repr=False, compare=False)
+    _align_rendered: Optional[str] = field(default=None, repr=False, compare=False)
+    _fill_rendered: Optional[str] = field(default=None, repr=False, compare=False)
+    _gutter_rendered: Optional[str] = field(default=None, repr=False, compare=False)
+    _column_gutter_rendered: Optional[str] = field(
+        default=None, repr=False, compare=False
+    )
+    _row_gutter_rendered: Optional[str] = field(default=None, repr=False, compare=False)
 
     @classmethod
     def from_dataframe(cls, df: pd.DataFrame) -> "Table":
@@ -107,11 +125,14 @@ class Table:
         table = cls()
         table.header_data = _parse_index(df.columns, direction="cols")
         table.index_data = _parse_index(df.index, direction="rows")
-        row_data: FrozenList[FrozenList[Cell]] = FrozenList([])
-        for _, *row in df.itertuples():
-            row_cells = FrozenList([Cell(value) for value in row])
-            row_cells.freeze()
-            row_data.append(row_cells)
+        # a single bulk extraction avoids the per-row namedtuple
+        # construction of itertuples; tolist converts every value to a
+        # Python scalar in one C call instead of boxing them one by one,
+        # and the row-major copy keeps that scan sequential in memory
+        values = np.ascontiguousarray(df.to_numpy()).tolist()
+        row_data: FrozenList[FrozenList[Cell]] = FrozenList(
+            [_frozen([Cell(value) for value in row]) for row in values]
+        )
         row_data.freeze()
         table.row_data = row_data
         table.columns = len(df.columns) + df.index.nlevels
@@ -157,29 +178,31 @@ class Table:
 
     @columns.setter
     def columns(self, value: int | str | list[str]) -> None:
-        if not isinstance(value, (int, str, list)):
-            raise ValueError("Columns must be an integer, string, or list of strings")
-        elif isinstance(value, list) and not all(isinstance(v, str) for v in value):
-            raise ValueError("All elements in the list must be strings")
-        elif isinstance(value, int) and not value == (
-            len(self.row_data[0]) + len(self.index_data)
-        ):
-            raise ValueError(
-                "Number of columns must match the number "
-                "of table columns plus index levels"
-            )
-        elif isinstance(value, list) and not len(value) == (
-            len(self.row_data[0]) + len(self.index_data)
-        ):
-            raise ValueError(
-                "If specifying columns as a list, "
-                "its length must match the number of table columns plus index levels"
-            )
-        if isinstance(value, list):
-            self._columns = FrozenList(value)
-            self._columns.freeze()
-        else:
+        # dispatch on the concrete type once so scalar assignments
+        # skip the list validation entirely
+        if type(value) is list:
+            if not all(isinstance(v, str) for v in value):
+                raise ValueError("All elements in the list must be strings")
+            if not len(value) == (len(self.row_data[0]) + len(self.index_data)):
+                raise ValueError(
+                    "If specifying columns as a list, "
+                    "its length must match the number of table columns "
+                    "plus index levels"
+                )
+            self._columns = _frozen(value)
+        elif isinstance(value, int):
+            if not value == (len(self.row_data[0]) + len(self.index_data)):
+                raise ValueError(
+                    "Number of columns must match the number "
+                    "of table columns plus index levels"
+                )
+            self._columns = value
+        elif isinstance(value, str):
             self._columns = value
+        else:
+            raise ValueError("Columns must be an integer, string, or list of strings")
+        # the validated input renders identically to the stored value
+        self._columns_rendered = render_type(value)
 
     @property
     def rows(self) -> Optional[int | str | FrozenList[str]]:
@@ -222,31 +245,29 @@ class Table:
 
     @rows.setter
     def rows(self, value: int | str | list[str]) -> None:
-        if not isinstance(value, (int, str, list)) and value is not None:
+        if type(value) is list:
+            if not all(isinstance(v, str) for v in value):
+                raise ValueError("All elements in the list must be strings")
+            if not len(value) == (len(self.row_data) + len(self.header_data)):
+                raise ValueError(
+                    "If specifying rows as a list, "
+                    "its length must match the number of table rows plus header levels"
+                )
+            self._rows = _frozen(value)
+        elif isinstance(value, int):
+            if not value == (len(self.row_data) + len(self.header_data)):
+                raise ValueError(
+                    "Number of rows must match the number "
+                    "of table rows plus header levels"
+                )
+            self._rows = value
+        elif isinstance(value, str) or value is None:
+            self._rows = value
+        else:
             raise ValueError(
                 "Rows must be an integer, string, list of strings, or None"
             )
-        elif isinstance(value, list) and not all(isinstance(v, str) for v in value):
-            raise ValueError("All elements in the list must be strings")
-        elif isinstance(value, int) and not value == (
-            len(self.row_data) + len(self.header_data)
-        ):
-            raise ValueError(
-                "Number of rows must match the number of table rows plus header levels"
-            )
-        elif isinstance(value, list) and not len(value) == (
-            len(self.row_data) + len(self.header_data)
-        ):
-            raise ValueError(
-                "If specifying rows as a list, "
-                "its length must match the number of table rows plus header levels"
-            )
-
-        if isinstance(value, list):
-            self._rows = FrozenList(value)
-            self._rows.freeze()
-        else:
-            self._rows = value
+        self._rows_rendered = None if value is None else render_type(value)
 
     @property
     def stroke(self) -> Optional[str | FrozenList[str] | frozendict[str, str]]:
@@ -297,25 +318,28 @@ class Table:
         return self._stroke
 
     @stroke.setter
-    def stroke(self, value: Optional[str | FrozenList[str] | dict[str, str]]) -> None:
-        if not isinstance(value, (str, list, dict)) and value is not None:
-            raise ValueError(
-                "Stroke must be a string, list of strings, dictionary, or None"
-            )
-        elif isinstance(value, list) and not all(isinstance(v, str) for v in value):
-            raise ValueError("All elements in the list must be strings")
-        elif isinstance(value, dict) and not all(
-            isinstance(k, str) and isinstance(v, str) for k, v in value.items()
-        ):
-            raise ValueError("All keys and values in the dictionary must be strings")
-
-        if isinstance(value, list):
-            self._stroke = FrozenList(value)
-            self._stroke.freeze()
+    def stroke(self, value: Optional[str | list[str] | dict[str, str]]) -> None:
+        if type(value) is list:
+            if not all(isinstance(v, str) for v in value):
+                raise ValueError("All elements in the list must be strings")
+            self._stroke = _frozen(value)
         elif isinstance(value, dict):
+            if not all(
+                isinstance(k, str) and isinstance(v, str) for k, v in value.items()
+            ):
+                raise ValueError(
+                    "All keys and values in the dictionary must be strings"
+                )
             self._stroke = frozendict(value)
-        else:
+        elif isinstance(value, str) or value is None:
             self._stroke = value
+        else:
+            raise ValueError(
+                "Stroke must be a string, list of strings, dictionary, or None"
+            )
+        self._stroke_rendered = (
+            None if self._stroke is None else render_type(self._stroke)
+        )
 
     @property
     def align(self) -> Optional[str | FrozenList[str]]:
@@ -354,15 +378,17 @@ class Table:
 
     @align.setter
     def align(self, value: Optional[str | list[str]]) -> None:
-        if not isinstance(value, (str, list)) and value is not None:
-            raise ValueError("Align must be a string, list of strings, or None")
-        elif isinstance(value, list) and not all(isinstance(v, str) for v in value):
-            raise ValueError("All elements in the align list must be strings")
-        if isinstance(value, list):
-            self._align = FrozenList(value)
-            self._align.freeze()
-        else:
+        if type(value) is list:
+            if not all(isinstance(v, str) for v in value):
+                raise ValueError("All elements in the align list must be strings")
+            self._align = _frozen(value)
+        elif isinstance(value, str) or value is None:
             self._align = value
+        else:
+            raise ValueError("Align must be a string, list of strings, or None")
+        self._align_rendered = (
+            None if self._align is None else render_type(self._align)
+        )
 
     @property
     def fill(self) -> Optional[str | FrozenList[str]]:
@@ -401,15 +427,15 @@ class Table:
 
     @fill.setter
     def fill(self, value: Optional[str | list[str]]) -> None:
-        if not isinstance(value, (str, list)) and value is not None:
-            raise ValueError("Fill must be a string, list of strings, or None")
-        elif isinstance(value, list) and not all(isinstance(v, str) for v in value):
-            raise ValueError("All elements in the fill list must be strings")
-        if isinstance(value, list):
-            self._fill = FrozenList(value)
-            self._fill.freeze()
-        else:
+        if type(value) is list:
+            if not all(isinstance(v, str) for v in value):
+                raise ValueError("All elements in the fill list must be strings")
+            self._fill = _frozen(value)
+        elif isinstance(value, str) or value is None:
             self._fill = value
+        else:
+            raise ValueError("Fill must be a string, list of strings, or None")
+        self._fill_rendered = None if self._fill is None else render_type(self._fill)
 
     @property
     def gutter(self) -> Optional[int | str | FrozenList[str]]:
@@ -448,15 +474,17 @@ class Table:
 
     @gutter.setter
     def gutter(self, value: Optional[int | str | list[str]]) -> None:
-        if not isinstance(value, (int | str, list)) and value is not None:
-            raise ValueError("Gutter must be an int, string, list of strings, or None")
-        elif isinstance(value, list) and not all(isinstance(v, str) for v in value):
-            raise ValueError("All elements in the gutter list must be strings")
-        if isinstance(value, list):
-            self._gutter = FrozenList(value)
-            self._gutter.freeze()
-        else:
+        if type(value) is list:
+            if not all(isinstance(v, str) for v in value):
+                raise ValueError("All elements in the gutter list must be strings")
+            self._gutter = _frozen(value)
+        elif isinstance(value, (int, str)) or value is None:
             self._gutter = value
+        else:
+            raise ValueError("Gutter must be an int, string, list of strings, or None")
+        self._gutter_rendered = (
+            None if self._gutter is None else render_type(self._gutter)
+        )
 
     @property
     def column_gutter(self) -> Optional[int | str | FrozenList[str]]:
@@ -495,17 +523,21 @@ class Table:
 
     @column_gutter.setter
     def column_gutter(self, value: Optional[int | str | list[str]]) -> None:
-        if not isinstance(value, (int | str, list)) and value is not None:
+        if type(value) is list:
+            if not all(isinstance(v, str) for v in value):
+                raise ValueError(
+                    "All elements in the column gutter list must be strings"
+                )
+            self._column_gutter = _frozen(value)
+        elif isinstance(value, (int, str)) or value is None:
+            self._column_gutter = value
+        else:
             raise ValueError(
                 "Column gutter must be an int, string, list of strings, or None"
             )
-        elif isinstance(value, list) and not all(isinstance(v, str) for v in value):
-            raise ValueError("All elements in the column gutter list must be strings")
-        if isinstance(value, list):
-            self._column_gutter = FrozenList(value)
-            self._column_gutter.freeze()
-        else:
-            self._column_gutter = value
+        self._column_gutter_rendered = (
+            None if self._column_gutter is None else render_type(self._column_gutter)
+        )
 
     @property
     def row_gutter(self) -> Optional[int | str | FrozenList[str]]:
@@ -544,17 +576,19 @@ class Table:
 
     @row_gutter.setter
     def row_gutter(self, value: Optional[int | str | list[str]]) -> None:
-        if not isinstance(value, (int | str, list)) and value is not None:
+        if type(value) is list:
+            if not all(isinstance(v, str) for v in value):
+                raise ValueError("All elements in the row gutter list must be strings")
+            self._row_gutter = _frozen(value)
+        elif isinstance(value, (int, str)) or value is None:
+            self._row_gutter = value
+        else:
             raise ValueError(
                 "Row gutter must be an int, string, list of strings, or None"
             )
-        elif isinstance(value, list) and not all(isinstance(v, str) for v in value):
-            raise ValueError("All elements in the row gutter list must be strings")
-        if isinstance(value, list):
-            self._row_gutter = FrozenList(value)
-            self._row_gutter.freeze()
-        else:
-            self._row_gutter = value
+        self._row_gutter_rendered = (
+            None if self._row_gutter is None else render_type(self._row_gutter)
+        )
 
     def add_hline(
         self,
@@ -643,50 +677,78 @@ class Table:
         Returns:
             The rendered table element.
         """
-        headers = itertools.chain(*self.header_data)
-        index_placeholder = Cell(
-            rowspan=len(self.header_data), colspan=len(self.index_data)
-        )
-        inner = (
-            self._render_args()
-            + self._render_lines()
-            + "table.header"
-            + index_placeholder.render()
-            + "".join(header.render() for header in headers)
-            + ",\n"
-            + self._render_rows()
-        )
+        inner = "".join(self._iter_inner())
         # indent body and args by 2 spaces
         table = "#table(\n  " + inner.replace("\n", "\n  ") + "\n)"
 
         return table
 
+    def render_into(self, buf: TextIO) -> None:
+        """
+        Render the table into a text buffer.
+
+        The table is written chunk by chunk, so the peak memory use is
+        bounded by the size of a row instead of the whole rendered table.
+
+        Args:
+            buf: The buffer to write to.
+        """
+        write = buf.write
+        write("#table(\n  ")
+        for chunk in self._iter_inner():
+            write(chunk.replace("\n", "\n  "))
+        write("\n)")
+
+    def _iter_inner(self) -> Iterator[str]:
+        # chunks carry no body indent; the callers apply it per chunk
+        yield self._render_args()
+        yield self._render_lines()
+        yield "table.header"
+        index_placeholder = Cell(
+            rowspan=len(self.header_data), colspan=len(self.index_data)
+        )
+        yield index_placeholder.render()
+        for level in self.header_data:
+            for cell in level:
+                yield cell.render()
+        yield ",\n"
+        row_data = self.row_data
+        prefixes = self._index_prefixes(len(row_data))
+        first = True
+        for i, row in enumerate(row_data):
+            if first:
+                first = False
+            else:
+                yield ",\n"
+            yield prefixes[i]
+            yield ", ".join([cell.render() for cell in row])
+
+    # rendered argument labels paired with the attributes that back them,
+    # in the order they appear in the output
+    _ARG_SPECS = (
+        ("columns: ", "_columns", "_columns_rendered"),
+        ("rows: ", "_rows", "_rows_rendered"),
+        ("stroke: ", "_stroke", "_stroke_rendered"),
+        ("align: ", "_align", "_align_rendered"),
+        ("fill: ", "_fill", "_fill_rendered"),
+        ("gutter: ", "_gutter", "_gutter_rendered"),
+        ("column-gutter: ", "_column_gutter", "_column_gutter_rendered"),
+        ("row-gutter: ", "_row_gutter", "_row_gutter_rendered"),
+    )
+
     def _render_args(self) -> str:
         args = []
-        if self._columns is not None:
-            columns = render_type(self._columns)
-            args.append(f"columns: {columns}")
-        if self._rows is not None:
-            rows = render_type(self._rows)
-            args.append(f"rows: {rows}")
-        if self._stroke is not None:
-            stroke = render_type(self._stroke)
-            args.append(f"stroke: {stroke}")
-        if self._align is not None:
-            align = render_type(self._align)
-            args.append(f"align: {align}")
-        if self._fill is not None:
-            fill = render_type(self._fill)
-            args.append(f"fill: {fill}")
-        if self._gutter is not None:
-            gutter = render_type(self._gutter)
-            args.append(f"gutter: {gutter}")
-        if self._column_gutter is not None:
-            column_gutter = render_type(self._column_gutter)
-            args.append(f"column-gutter: {column_gutter}")
-        if self._row_gutter is not None:
-            row_gutter = render_type(self._row_gutter)
-            args.append(f"row-gutter: {row_gutter}")
+        for label, attr, rendered_attr in self._ARG_SPECS:
+            value = getattr(self, attr)
+            if value is not None:
+                rendered = getattr(self, rendered_attr)
+                if rendered is None:
+                    # fields set through the dataclass initializer
+                    # bypass the setters, so render them here
+                    rendered = render_type(value)
+                args.append(label + rendered)
+        if not args:
+            return ""
         rendered_args = ",\n".join(args) + ",\n"
 
         return rendered_args
@@ -699,25 +761,20 @@ class Table:
 
         return rendered_lines
 
-    def _render_rows(self) -> str:
-        table = ""
-        rows_to_skip = [0] * len(self.index_data)
-        index_positions = [0] * len(self.index_data)
-        for row in self.row_data:
-            for level in range(len(self.index_data)):
-                if rows_to_skip[level] == 0:
-                    index_cell = self.index_data[level][index_positions[level]]
-                    table += index_cell.render() + ", "
-                    index_positions[level] += 1
-                    rows_to_skip[level] = index_cell.rowspan
-                rows_to_skip[level] -= 1
-            table += ", ".join(cell.render() for cell in row) + ",\n"
-        table = table[:-2]  # remove trailing comma and newline
+    def _index_prefixes(self, num_rows: int) -> list[str]:
+        # walking each index level once up front replaces the per-row,
+        # per-level skip bookkeeping with a single lookup in the row loop
+        prefixes = [""] * num_rows
+        for level in self.index_data:
+            row = 0
+            for cell in level:
+                prefixes[row] += cell.render() + ", "
+                row += cell.rowspan
 
-        return table
+        return prefixes
 
 
-@dataclass
+@dataclass(slots=True)
 class TableLine:
     pos: int
     orientation: Literal["horizontal", "vertical"]
@@ -727,28 +784,33 @@ class TableLine:
     position: Optional[Literal["start", "end"]] = None
 
     def render(self) -> str:
-        args = []
+        # pick the function name and position label once instead of
+        # templating the line and formatting it afterwards
         if self.orientation == "horizontal":
-            line = "table.hline({0})"
-            args.append(f"y: {self.pos}")
+            name = "table.hline("
+            pos = f"y: {self.pos}"
         else:
-            line = "table.vline({0})"
-            args.append(f"x: {self.pos}")
+            name = "table.vline("
+            pos = f"x: {self.pos}"
+        stroke = self.stroke
+        if isinstance(stroke, dict):
+            stroke = render_mapping(stroke)
+        args = (
+            pos,
+            f"start: {self.start}" if self.start is not None else None,
+            f"end: {self.end}" if self.end is not None else None,
+            f"stroke: {stroke}" if stroke is not None else None,
+            f"position: {self.position}" if self.position is not None else None,
+        )
+
+        return name + ", ".join(a for a in args if a is not None) + ")"
 
-        if self.start is not None:
-            args.append(f"start: {self.start}")
-        if self.end is not None:
-            args.append(f"end: {self.end}")
-        if self.stroke is not None:
-            stroke = self.stroke
-            if isinstance(self.stroke, dict):
-                stroke = render_mapping(self.stroke)
-            args.append(f"stroke: {stroke}")
-        if self.position is not None:
-            args.append(f"position: {self.position}")
-        line = line.format(", ".join(args))
 
-        return line
+def _frozen(value: list) -> FrozenList:
+    frozen: FrozenList = FrozenList(value)
+    frozen.freeze()
+
+    return frozen
 
 
 def _parse_index(
@@ -760,11 +822,15 @@ def _parse_index(
     elif isinstance(index, pd.MultiIndex):
         headers = _parse_multi_index(index, direction)
     else:
-        headers = [[Cell(header, colspan=1) for header in index]]
-
-    frozen_headers = FrozenList(FrozenList(header) for header in headers)
-    for header in frozen_headers:
-        header.freeze()
+        # bulk conversion to Python scalars instead of per-element
+        # dispatch through the Index wrapper
+        headers = [[Cell(header, colspan=1) for header in index.to_numpy().tolist()]]
+
+    # freeze each level as it is wrapped instead of a second pass
+    # over the freshly built outer list
+    frozen_headers: FrozenList[FrozenList[Cell]] = FrozenList([])
+    for header in headers:
+        frozen_headers.append(_frozen(header))
     frozen_headers.freeze()
 
     return frozen_headers
@@ -784,31 +850,26 @@ def _parse_multi_index(
 def _parse_level(
     index: pd.MultiIndex, level: int, direction: Literal["rows", "cols"]
 ) -> list["Cell"]:
-    span_arg = _get_span_arg(direction)
-    level_codes = index.codes[level]
-    headers = []
-    span = 0
-    prev_code = level_codes[0]
-    for code in level_codes:
-        if code == prev_code:
-            span += 1
-        else:
-            headers.append(Cell(index.levels[level][prev_code]))
-            setattr(headers[-1], span_arg, span)
-            prev_code = code
-            span = 1
-    headers.append(Cell(index.levels[level][-1]))
-    setattr(headers[-1], span_arg, span)
-
-    return headers
-
-
-def _get_span_arg(direction: Literal["rows", "cols"]) -> str:
+    # run-length encode the level codes in NumPy instead of
+    # comparing neighboring codes one by one in Python
+    codes = np.asarray(index.codes[level])
+    starts = np.r_[0, np.flatnonzero(codes[1:] != codes[:-1]) + 1]
+    spans = np.diff(np.r_[starts, len(codes)])
+    rep_codes = codes[starts]
+    level_values = index.levels[level]
+    # select the span keyword once so the loop constructs each cell
+    # with its final span instead of a dynamic setattr afterwards
     if direction == "rows":
-        span_arg = "rowspan"
+        headers = [
+            Cell(level_values[code], rowspan=span)
+            for code, span in zip(rep_codes.tolist(), spans.tolist())
+        ]
     elif direction == "cols":
-        span_arg = "colspan"
+        headers = [
+            Cell(level_values[code], colspan=span)
+            for code, span in zip(rep_codes.tolist(), spans.tolist())
+        ]
     else:
         raise ValueError(f"Invalid direction: {direction}")
 
-    return span_arg
+    return headers
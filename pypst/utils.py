@@ -1,4 +1,4 @@
-from typing import Sequence, Mapping, Iterable, Any
+from typing import Sequence, Mapping, Iterable, Any, Callable, TextIO
 
 from pypst.renderable import Renderable
 
@@ -12,9 +12,26 @@ def render(obj: Renderable | int | str | Sequence[str] | Mapping[str, str]) -> s
     return rendered
 
 
+def render_into(
+    obj: Renderable | int | str | Sequence[str] | Mapping[str, str], buf: TextIO
+) -> None:
+    # objects satisfying Renderable structurally may lack render_into
+    write = getattr(obj, "render_into", None)
+    if write is not None:
+        write(buf)
+    else:
+        buf.write(render(obj))
+
+
 def render_type(arg: int | str | bool | Sequence[str] | Mapping[str, str]) -> str:
+    # exact-type dispatch handles the common cases with one dict lookup;
+    # subclasses and other sequence/mapping types take the isinstance chain
+    render_fn = _RENDER_DISPATCH.get(type(arg))
+    if render_fn is not None:
+        return render_fn(arg)
+
     if isinstance(arg, bool):
-        rendered_arg = str(arg).lower()
+        rendered_arg = "true" if arg else "false"
     elif isinstance(arg, int | float):
         rendered_arg = str(arg)
     elif isinstance(arg, str):
@@ -34,4 +51,15 @@ def render_mapping(arg: Mapping[str, str | int | float]) -> str:
 
 
 def render_sequence(arg: Iterable[Any]) -> str:
-    return f"({', '.join(a for a in arg)})"
+    return f"({', '.join(arg)})"
+
+
+_RENDER_DISPATCH: dict[type, Callable[[Any], str]] = {
+    bool: lambda arg: "true" if arg else "false",
+    int: str,
+    float: str,
+    str: lambda arg: arg,
+    list: render_sequence,
+    tuple: render_sequence,
+    dict: render_mapping,
+}
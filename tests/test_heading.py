@@ -56,9 +56,8 @@ def test_heading_with_bookmarked():
 
 
 @pytest.mark.integration
-@pytest.mark.parametrize(
-    "heading",
-    [
+def test_compilation(tmp_path):
+    headings = [
         Heading('"Hello"', level=1, numbering='"1.1"'),
         Heading('"Hello"', level=2),
         Heading('"Hello"', supplement='"World"'),
@@ -67,10 +66,9 @@ def test_heading_with_bookmarked():
         Heading('"Hello"', outlined=True),
         Heading("#emph[Hello]", level=1),
         Heading("#emph[Hello]", depth=1),
-    ],
-)
-def test_compilation(heading, tmp_path):
+    ]
+    # one compilation run covers all cases
     with open(tmp_path / "test.typ", mode="wt") as f:
-        f.write(heading.render())
+        f.write("\n#pagebreak()\n".join(heading.render() for heading in headings))
 
     typst.compile(tmp_path / "test.typ")
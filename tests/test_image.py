@@ -35,17 +35,17 @@ def test_image_with_fit():
 
 
 @pytest.mark.integration
-@pytest.mark.parametrize(
-    "image",
-    [
+def test_compilation(image_on_disk):
+    images = [
         Image("image.png"),
         Image('"image.png"'),
         Image("image.png", format="png", width="100pt", alt='"This is an image"'),
         Image("image.png", width="100pt", height="100pt", fit="contain"),
-    ],
-)
-def test_compilation(image, image_on_disk, tmp_path):
-    with open(tmp_path / "test.typ", mode="wt") as f:
-        f.write(image.render())
-
-    typst.compile(tmp_path / "test.typ")
+    ]
+    # the image path is relative, so the file goes next to the image;
+    # one compilation run covers all cases
+    test_file = image_on_disk.parent / "test.typ"
+    with open(test_file, mode="wt") as f:
+        f.write("\n#pagebreak()\n".join(image.render() for image in images))
+
+    typst.compile(test_file)
@@ -7,6 +7,12 @@ from pypst.table import TableLine
 from tests.conftest import generate_all_combinations, create_table
 
 
+def _unindent(table):
+    # strip the two-space body indentation so the expected strings below
+    # stay readable
+    return table.render().replace("\n  ", "\n")
+
+
 def test_from_dataframe_simple_headers(df):
     assert df.header_data == [[Cell("A"), Cell("B"), Cell("C")]]
 
@@ -19,7 +25,7 @@ def test_from_dataframe_multi_headers(df_multi_header):
 
 
 def test_render_simple_table(df):
-    rendered = df.render().replace("\n  ", "\n")
+    rendered = _unindent(df)
     assert rendered == (
         "#table(\ncolumns: 4,\ntable.header[][A][B][C],"
         "\n[0], [1], [4], [7],"
@@ -29,7 +35,7 @@ def test_render_simple_table(df):
 
 
 def test_render_multi_header(df_multi_header):
-    rendered = df_multi_header.render().replace("\n  ", "\n")
+    rendered = _unindent(df_multi_header)
     assert rendered == (
         "#table(\ncolumns: 5,\n"
         "table.header[#table.cell(rowspan: 2)[]]"
@@ -42,7 +48,7 @@ def test_render_multi_header(df_multi_header):
 
 
 def test_render_multi_index(df_multi_index):
-    rendered = df_multi_index.render().replace("\n  ", "\n")
+    rendered = _unindent(df_multi_index)
     assert rendered == (
         "#table(\n"
         "columns: 5,\n"
@@ -57,7 +63,7 @@ def test_render_multi_index(df_multi_index):
 
 def test_render_custom_col(df):
     df.columns = ["10%", "20%", "30%", "40%"]
-    rendered = df.render().replace("\n  ", "\n")
+    rendered = _unindent(df)
     assert rendered == (
         "#table(\ncolumns: (10%, 20%, 30%, 40%),\ntable.header[][A][B][C],"
         "\n[0], [1], [4], [7],"
@@ -68,7 +74,7 @@ def test_render_custom_col(df):
 
 def test_render_custom_row(df):
     df.rows = ["10%", "20%", "30%", "40%"]
-    rendered = df.render().replace("\n  ", "\n")
+    rendered = _unindent(df)
     assert rendered == (
         "#table(\ncolumns: 4,\nrows: (10%, 20%, 30%, 40%),\ntable.header[][A][B][C],"
         "\n[0], [1], [4], [7],"
@@ -89,7 +95,7 @@ def test_render_custom_row(df):
 )
 def test_render_custom_stroke(df, stroke, rendered_stroke):
     df.stroke = stroke
-    rendered = df.render().replace("\n  ", "\n")
+    rendered = _unindent(df)
     assert rendered == (
         f"#table(\ncolumns: 4,\nstroke: {rendered_stroke},\ntable.header[][A][B][C],"
         "\n[0], [1], [4], [7],"
@@ -108,7 +114,7 @@ def test_render_custom_stroke(df, stroke, rendered_stroke):
 )
 def test_render_custom_align(df, align, rendered_align):
     df.align = align
-    rendered = df.render().replace("\n  ", "\n")
+    rendered = _unindent(df)
     assert rendered == (
         f"#table(\ncolumns: 4,\nalign: {rendered_align},\ntable.header[][A][B][C],"
         "\n[0], [1], [4], [7],"
@@ -127,7 +133,7 @@ def test_render_custom_align(df, align, rendered_align):
 )
 def test_render_custom_fill(df, fill, rendered_fill):
     df.fill = fill
-    rendered = df.render().replace("\n  ", "\n")
+    rendered = _unindent(df)
     assert rendered == (
         f"#table(\ncolumns: 4,\nfill: {rendered_fill},\ntable.header[][A][B][C],"
         "\n[0], [1], [4], [7],"
@@ -147,7 +153,7 @@ def test_render_custom_fill(df, fill, rendered_fill):
 )
 def test_render_custom_gutter(df, gutter_attribute, gutter, rendered_gutter):
     setattr(df, gutter_attribute, gutter)
-    rendered = df.render().replace("\n  ", "\n")
+    rendered = _unindent(df)
     assert rendered == (
         f"#table(\ncolumns: 4,\n{gutter_attribute.replace('_', '-')}: {rendered_gutter},"
         f"\ntable.header[][A][B][C],"
@@ -170,7 +176,7 @@ def test_render_lines(df, lines, rendered_lines):
             df.add_hline(line)
         else:
             df.add_vline(line)
-    rendered = df.render().replace("\n  ", "\n")
+    rendered = _unindent(df)
     assert rendered == (
         f"#table(\ncolumns: 4,\n{rendered_lines},\ntable.header[][A][B][C],"
         "\n[0], [1], [4], [7],"
@@ -184,11 +190,8 @@ def test_attributes_are_frozen(table, tmp_path, request):
     table = request.getfixturevalue(table)
 
     def _check_all_frozen(obj):
-        assert isinstance(obj, FrozenList)
-        assert obj.frozen
-        for element in obj:
-            assert isinstance(element, FrozenList)
-            assert element.frozen
+        assert isinstance(obj, FrozenList) and obj.frozen
+        assert all(isinstance(e, FrozenList) and e.frozen for e in obj)
 
     _check_all_frozen(table.header_data)
     _check_all_frozen(table.index_data)